@@ -21,6 +21,9 @@ __all__ = [
 ]
 
 import contextlib
+import itertools
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Iterable,
     List,
@@ -52,6 +55,14 @@ except ImportError:
 
 INTEGRATION_VERSION_KEY = "source_code/integrations/neptune-optuna"
 
+# Number of trials accumulated before a batched `trials/*` assignment is flushed to Neptune.
+_TRIALS_FLUSH_THRESHOLD = 64
+
+# Upper bound on threads used to render independent plots concurrently.
+_PLOT_RENDER_WORKERS = 4
+
+_SUPPORTED_VIS_BACKENDS = ("plotly", "matplotlib")
+
 
 class NeptuneCallback:
     """A callback that logs metadata from an Optuna Study to Neptune.
@@ -117,10 +128,53 @@ class NeptuneCallback:
         >>> study = optuna.create_study(direction="maximize")
         ... study.optimize(objective, n_trials=5, callbacks=[neptune_callback])
 
+        Wait for background plot rendering before stopping the run:
+        >>> neptune_callback.flush()
+
     For more, see the Neptune-Optuna integration guide:
     https://docs.neptune.ai/integrations/optuna
     """
 
+    # The callback is read on every trial, so its attributes live in slots, keeping
+    # hot lookups off the instance dict. __weakref__ and __dict__ stay so the class
+    # remains weak-referenceable and open to ad-hoc user attributes.
+    __slots__ = (
+        "__weakref__",
+        "__dict__",
+        "run",
+        "_trials_handle",
+        "_best_handle",
+        "_distributions_handle",
+        "_visualization_backend",
+        "_vis_module",
+        "_plots_update_freq",
+        "_study_update_freq",
+        "_log_plot_contour",
+        "_log_plot_edf",
+        "_log_plot_parallel_coordinate",
+        "_log_plot_param_importances",
+        "_log_plot_pareto_front",
+        "_log_plot_slice",
+        "_log_plot_intermediate_values",
+        "_log_plot_optimization_history",
+        "_plot_kwargs",
+        "_any_plot_enabled",
+        "_target_names",
+        "_log_all_trials",
+        "_namespaces",
+        "_is_multi",
+        "_logged_best_trials",
+        "_logged_distributions",
+        "_study_details_logged",
+        "_last_plotted_complete_count",
+        "_plot_ticks",
+        "_study_ticks",
+        "_series_ticks",
+        "_plots_executor",
+        "_pending_plots",
+        "_deferred_plots",
+    )
+
     def __init__(
         self,
         run: Union[neptune.Run, neptune.handler.Handler],
@@ -169,7 +223,18 @@ class NeptuneCallback:
         verify_type("log_all_trials", log_all_trials, bool)
 
         self.run = run[base_namespace] if base_namespace != "" else run
+        # Sub-handles touched on every invocation, resolved once so hot paths skip
+        # repeated path parsing.
+        self._trials_handle = self.run["trials"]
+        self._best_handle = self.run["best"]
+        self._distributions_handle = self.run["study/distributions"]
+        if visualization_backend not in _SUPPORTED_VIS_BACKENDS:
+            raise NotImplementedError(f"{visualization_backend} visualisation backend is not implemented")
+
         self._visualization_backend = visualization_backend
+        # Importing the backend pulls in plotly or matplotlib, so it is deferred
+        # until the first plot actually renders.
+        self._vis_module = None
         self._plots_update_freq = plots_update_freq
         self._study_update_freq = study_update_freq
         self._log_plot_contour = log_plot_contour
@@ -180,9 +245,35 @@ class NeptuneCallback:
         self._log_plot_slice = log_plot_slice
         self._log_plot_intermediate_values = log_plot_intermediate_values
         self._log_plot_optimization_history = log_plot_optimization_history
+        # Computed once so each refresh neither rebuilds the flag set nor runs at all
+        # when every plot is disabled.
+        self._plot_kwargs = {
+            "log_plot_contour": log_plot_contour,
+            "log_plot_edf": log_plot_edf,
+            "log_plot_parallel_coordinate": log_plot_parallel_coordinate,
+            "log_plot_param_importances": log_plot_param_importances,
+            "log_plot_pareto_front": log_plot_pareto_front,
+            "log_plot_slice": log_plot_slice,
+            "log_plot_optimization_history": log_plot_optimization_history,
+            "log_plot_intermediate_values": log_plot_intermediate_values,
+        }
+        self._any_plot_enabled = any(self._plot_kwargs.values())
         self._target_names = target_names
         self._log_all_trials = log_all_trials
         self._namespaces = None
+        self._is_multi = None
+        self._logged_best_trials = {}
+        self._logged_distributions = None
+        self._study_details_logged = False
+        self._last_plotted_complete_count = 0
+        # itertools.count advances atomically under the GIL, so concurrent callbacks
+        # (study.optimize with n_jobs>1) never observe the same tick.
+        self._plot_ticks = itertools.count()
+        self._study_ticks = itertools.count()
+        self._series_ticks = itertools.count()
+        self._plots_executor = None
+        self._pending_plots = None
+        self._deferred_plots = None
 
         root_obj = self.run
         if isinstance(self.run, neptune.handler.Handler):
@@ -193,73 +284,222 @@ class NeptuneCallback:
     def __call__(self, study: optuna.Study, trial: optuna.trial.FrozenTrial):
         if self._namespaces is None:
             self._namespaces = _get_namespaces(study, self._target_names)
+            # The direction count is fixed for a study's lifetime, so resolve it once.
+            self._is_multi = _is_multi_objective(study=study)
+
+        # Snapshot the trial list once per invocation; every `study.trials` /
+        # `study.get_trials()` access copies the whole list otherwise.
+        trials = study.get_trials(deepcopy=False)
 
         if self._log_all_trials:
             self._log_trial(study, trial)
         self._log_trial_distributions(trial)
-        self._log_best_trials(study)
+        self._log_best_trials(study, trials)
         self._log_study_details(study, trial)
-        self._log_plots(study, trial)
+        self._log_plots(study, trial, trials)
         self._log_study(study, trial)
 
     def _log_trial(self, study, trial):
-        _log_single_trial(self.run, study, trial=trial, namespaces=self._namespaces)
+        # With n_jobs>1 trials finish out of order, so trial numbers are not valid
+        # (strictly increasing) series steps; the invocation counter is.
+        _log_single_trial(
+            self.run,
+            study,
+            trial=trial,
+            namespaces=self._namespaces,
+            is_multi=self._is_multi,
+            handle=self._trials_handle,
+            step=next(self._series_ticks),
+        )
 
     def _log_trial_distributions(self, trial):
-        self.run["study/distributions"] = stringify_unsupported(trial.distributions)
+        distributions = trial.distributions
+        if distributions != self._logged_distributions:
+            self._distributions_handle.assign(stringify_unsupported(distributions))
+            self._logged_distributions = dict(distributions)
+
+    def _log_best_trials(self, study, trials):
+        best_trials = _get_best_trials(study, trials)
+        if not best_trials:
+            return
+
+        current = {trial._trial_id: trial for trial in best_trials}
+        if current.keys() == self._logged_best_trials.keys():
+            return
+
+        handle = self._best_handle
+        for trial_id in self._logged_best_trials.keys() - current.keys():
+            del handle[f"trials/{self._logged_best_trials[trial_id]}"]
+
+        new_ids = current.keys() - self._logged_best_trials.keys()
+        for trial_id in sorted(new_ids, key=lambda trial_id: current[trial_id]._number):
+            _log_single_trial(
+                self.run,
+                study,
+                trial=current[trial_id],
+                namespaces=self._namespaces,
+                best=True,
+                is_multi=self._is_multi,
+                handle=handle,
+                summary=False,
+            )
+
+        if new_ids:
+            # study.best_params/best_value break value ties by lowest trial number, so
+            # a tied front member must not overwrite the scalar summary; write it once
+            # from the canonical trial. Multi-objective keeps the batched-path
+            # convention of reflecting the last best trial.
+            if self._is_multi:
+                summary_trial = max(best_trials, key=lambda trial: trial._number)
+            else:
+                summary_trial = min(best_trials, key=lambda trial: trial._number)
+            _log_best_summary(handle, summary_trial, self._namespaces, self._is_multi)
 
-    def _log_best_trials(self, study):
-        _log_best_trials(self.run, study, namespaces=self._namespaces)
+        self._logged_best_trials = {trial_id: trial._number for trial_id, trial in current.items()}
 
     def _log_study_details(self, study, trial):
-        if trial._number == 0:
+        # Static study metadata goes out exactly once per callback, regardless of the
+        # number of the first trial this callback happens to see.
+        if not self._study_details_logged:
             _log_study_details(self.run, study)
-
-    def _log_plots(self, study, trial):
-        if self._should_log_plots(study, trial):
+            self._study_details_logged = True
+
+    def _log_plots(self, study, trial, trials):
+        n_complete = sum(t.state == optuna.trial.TrialState.COMPLETE for t in trials)
+        if not self._should_log_plots(study, trial, n_complete):
+            return
+
+        future = self._pending_plots
+        if future is not None:
+            if not future.done():
+                # The previous render is still in flight; remember the fresher state so
+                # a later refresh (or flush) can catch the plots up.
+                self._deferred_plots = (study, trials, n_complete)
+                return
+            self._pending_plots = None
+            future.result()
+        self._deferred_plots = None
+
+        if self._vis_module is None:
+            self._vis_module = _get_vis_module(self._visualization_backend)
+
+        def render():
             _log_plots(
                 self.run,
                 study,
+                trials=trials,
                 visualization_backend=self._visualization_backend,
-                log_plot_contour=self._log_plot_contour,
-                log_plot_edf=self._log_plot_edf,
-                log_plot_parallel_coordinate=self._log_plot_parallel_coordinate,
-                log_plot_param_importances=self._log_plot_param_importances,
-                log_plot_pareto_front=self._log_plot_pareto_front,
-                log_plot_slice=self._log_plot_slice,
-                log_plot_optimization_history=self._log_plot_optimization_history,
-                log_plot_intermediate_values=self._log_plot_intermediate_values,
                 namespaces=self._namespaces,
+                vis_module=self._vis_module,
+                **self._plot_kwargs,
             )
 
+        if self._visualization_backend == "plotly":
+            # Rendering plus HTML serialization dominates callback latency, so it runs on
+            # a worker thread. Matplotlib is not thread-safe and stays synchronous.
+            if self._plots_executor is None:
+                self._plots_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="neptune-optuna-plots")
+            self._pending_plots = self._plots_executor.submit(render)
+            # Failures in a render that is never awaited (e.g. the last of a study)
+            # would otherwise disappear with the future.
+            self._pending_plots.add_done_callback(_warn_render_failure)
+        else:
+            render()
+
+        self._last_plotted_complete_count = n_complete
+
+    def flush(self):
+        """Waits for in-flight background plot rendering and catches up skipped refreshes.
+
+        Call this after optimization finishes and before stopping the run; a render
+        still running at that point would write to a stopped run. It is safe to keep
+        using the callback afterwards.
+        """
+        future = self._pending_plots
+        self._pending_plots = None
+        if future is not None:
+            future.result()
+
+        deferred = self._deferred_plots
+        self._deferred_plots = None
+        if deferred is not None:
+            study, trials, n_complete = deferred
+            if n_complete != self._last_plotted_complete_count:
+                _log_plots(
+                    self.run,
+                    study,
+                    trials=trials,
+                    visualization_backend=self._visualization_backend,
+                    namespaces=self._namespaces,
+                    vis_module=self._vis_module,
+                    **self._plot_kwargs,
+                )
+                self._last_plotted_complete_count = n_complete
+
+        if self._plots_executor is not None:
+            self._plots_executor.shutdown(wait=True)
+            self._plots_executor = None
+
+    def __del__(self):
+        # Best effort only; render failures were already surfaced by the done callback.
+        # Plain try/except because module globals may be gone at interpreter shutdown.
+        try:
+            self.flush()
+        except Exception:
+            pass
+
     def _log_study(self, study, trial):
         if self._should_log_study(trial):
             _log_study(self.run, study)
 
-    def _should_log_plots(self, study: optuna.study.Study, trial: optuna.trial.FrozenTrial):
-        if not len(study.get_trials(states=(optuna.trial.TrialState.COMPLETE,))):
+    def _should_log_plots(
+        self,
+        study: optuna.study.Study,
+        trial: optuna.trial.FrozenTrial,
+        n_complete: int,
+    ):
+        # Count invocations instead of relying on trial numbers, which are not
+        # guaranteed to be sequential (e.g. resumed or distributed studies).
+        tick = next(self._plot_ticks)
+
+        if not self._any_plot_enabled:
+            return False
+        if not n_complete:
+            return False
+        elif n_complete == self._last_plotted_complete_count:
+            # Plots depend only on finished trials, so there is nothing new to render.
             return False
         elif self._plots_update_freq == "never":
             return False
         else:
-            if trial._number % self._plots_update_freq == 0:
+            if tick % self._plots_update_freq == 0:
                 return True
         return False
 
     def _should_log_study(self, trial: optuna.trial.FrozenTrial):
+        # Invocation counter instead of trial numbers, which may not be sequential.
+        tick = next(self._study_ticks)
+
         if self._study_update_freq == "never":
             return False
-        return trial._number % self._study_update_freq == 0
+        return tick % self._study_update_freq == 0
+
+
+def _warn_render_failure(future):
+    if not future.cancelled() and future.exception() is not None:
+        warnings.warn(f"Neptune-Optuna background plot rendering failed: {future.exception()!r}")
 
 
 def _log_best_trials(run, study: optuna.Study, namespaces):
-    if _is_multi_objective(study=study):
+    is_multi = _is_multi_objective(study=study)
+    if is_multi:
         _log_trials(
             run,
             study,
-            trials=study.best_trials,
+            trials=_get_best_trials(study),
             namespaces=namespaces,
             best=True,
+            is_multi=is_multi,
         )
     else:
         _log_single_trial(
@@ -268,6 +508,7 @@ def _log_best_trials(run, study: optuna.Study, namespaces):
             trial=study.best_trial,
             namespaces=namespaces,
             best=True,
+            is_multi=is_multi,
         )
 
 
@@ -275,6 +516,21 @@ def _is_multi_objective(study: optuna.Study) -> bool:
     return len(study.directions) > 1
 
 
+def _get_best_trials(study: optuna.Study, trials: Optional[List[optuna.trial.FrozenTrial]] = None):
+    """Returns the best (Pareto-front) trials without the deepcopy study.best_trials performs."""
+    if trials is None:
+        trials = study.get_trials(deepcopy=False)
+
+    with contextlib.suppress(ImportError, AttributeError, TypeError):
+        from optuna.study._multi_objective import _get_pareto_front_trials_by_trials
+        from optuna.study.study import _CONSTRAINTS_KEY
+
+        is_constrained = any(_CONSTRAINTS_KEY in trial.system_attrs for trial in trials)
+        return _get_pareto_front_trials_by_trials(trials, study.directions, consider_constraint=is_constrained)
+
+    return study.best_trials
+
+
 def _get_namespaces(study: optuna.Study, target_names: Optional[List[str]] = None) -> Union[List[str], str]:
     if _is_multi_objective(study=study):
         if target_names is None:
@@ -293,11 +549,11 @@ def _get_namespaces(study: optuna.Study, target_names: Optional[List[str]] = Non
         if target_names is None:
             return "objective_value"
 
-        assert len(target_names) == len(
-            [study.direction]
+        assert (
+            len(target_names) == 1
         ), f"""
             The target_names list must be the same length as study.direction.
-            target_names length: {len(target_names)} != study.directions length: {len([study.direction])}
+            target_names length: {len(target_names)} != study.directions length: 1
             """
 
         return target_names[0]
@@ -391,17 +647,10 @@ def log_study_metadata(
 
     namespaces = _get_namespaces(study, target_names)
 
-    _log_best_trials(run, study, namespaces=namespaces)
-    _log_study_details(run, study)
-
-    if log_all_trials:
-        _log_trials(run, study, study.trials, namespaces=namespaces)
+    # One snapshot for the whole call; study.trials copies the list on every access.
+    trials = study.get_trials(deepcopy=False)
 
-    if log_distributions:
-        for i, trial in enumerate(study.trials):
-            run[f"study/distributions/trial/{i}"] = stringify_unsupported(trial.distributions)
-
-    if log_plots:
+    def render_plots():
         _log_plots(
             run,
             study,
@@ -415,10 +664,45 @@ def log_study_metadata(
             log_plot_optimization_history=log_plot_optimization_history,
             log_plot_intermediate_values=log_plot_intermediate_values,
             namespaces=namespaces,
+            trials=trials,
         )
 
+    background = []
+    if log_plots:
+        background.append(render_plots)
     if log_study:
-        _log_study(run, study)
+        background.append(lambda: _log_study(run, study))
+
+    # Plot rendering and study pickling are CPU-bound, so they can overlap with
+    # queuing the per-trial metadata below. Matplotlib is not thread-safe, so
+    # that backend keeps everything on the calling thread.
+    executor = None
+    futures = []
+    if background and visualization_backend == "plotly":
+        executor = ThreadPoolExecutor(max_workers=len(background))
+        futures = [executor.submit(job) for job in background]
+
+    _log_best_trials(run, study, namespaces=namespaces)
+    _log_study_details(run, study)
+
+    if log_all_trials:
+        _log_trials(run, study, trials, namespaces=namespaces)
+
+    if log_distributions:
+        # One batched assignment instead of a write per trial.
+        run["study/distributions"] = {
+            "trial": {str(i): stringify_unsupported(trial.distributions) for i, trial in enumerate(trials)}
+        }
+
+    if executor is not None:
+        try:
+            for future in futures:
+                future.result()
+        finally:
+            executor.shutdown()
+    else:
+        for job in background:
+            job()
 
 
 def load_study_from_run(run: neptune.Run):
@@ -458,6 +742,24 @@ def load_study_from_run(run: neptune.Run):
         )
 
 
+# Resolved backend modules, keyed by backend name. The underlying imports pull in
+# plotly or matplotlib, which are too heavy to re-resolve on every plot refresh.
+_VIS_MODULES = {}
+
+
+def _get_vis_module(visualization_backend: str):
+    vis = _VIS_MODULES.get(visualization_backend)
+    if vis is None:
+        if visualization_backend == "matplotlib":
+            import optuna.visualization.matplotlib as vis
+        elif visualization_backend == "plotly":
+            import optuna.visualization as vis
+        else:
+            raise NotImplementedError(f"{visualization_backend} visualisation backend is not implemented")
+        _VIS_MODULES[visualization_backend] = vis
+    return vis
+
+
 def _log_study_details(run, study: optuna.Study):
     run["study/study_name"] = study.study_name
 
@@ -472,27 +774,58 @@ def _log_study_details(run, study: optuna.Study):
         run["study/_storage"] = stringify_unsupported(study._storage)
 
 
+def _build_storage_dispatch():
+    dispatch = []
+    with contextlib.suppress(AttributeError):
+        dispatch.append((optuna.storages.RedisStorage, "RedisStorage", lambda storage: storage._url))
+    with contextlib.suppress(AttributeError):
+        # apparently CachedStorage typically wraps RDBStorage
+        dispatch.append((optuna.storages._CachedStorage, "RDBStorage", lambda storage: storage._backend.url))
+    with contextlib.suppress(AttributeError):
+        dispatch.append((optuna.storages.RDBStorage, "RDBStorage", lambda storage: storage.url))
+    return dispatch
+
+
+_STORAGE_DISPATCH = _build_storage_dispatch()
+_STORAGE_DISPATCH_BY_TYPE = {}
+
+
+def _build_pickled_storage_types():
+    types = set()
+    with contextlib.suppress(AttributeError):
+        types.add(optuna.storages._in_memory.InMemoryStorage)
+    return types
+
+
+# Storage classes whose studies are pickled to the run instead of referenced by URL.
+_PICKLED_STORAGE_TYPES = _build_pickled_storage_types()
+
+
+def _storage_info(storage):
+    entry = _STORAGE_DISPATCH_BY_TYPE.get(type(storage))
+    if entry is None:
+        for cls, storage_type, get_url in _STORAGE_DISPATCH:
+            if isinstance(storage, cls):
+                entry = (storage_type, get_url)
+                break
+        else:
+            entry = ("unknown storage type", None)
+        _STORAGE_DISPATCH_BY_TYPE[type(storage)] = entry
+    return entry
+
+
 def _log_study(run, study: optuna.Study):
     with contextlib.suppress(AttributeError):
-        if type(study._storage) is optuna.storages._in_memory.InMemoryStorage:
+        if type(study._storage) in _PICKLED_STORAGE_TYPES:
             """pickle and log the study object to the 'study/study.pkl' path"""
             run["study/study_name"] = study.study_name
             run["study/storage_type"] = "InMemoryStorage"
-            run["study/study"] = File.as_pickle(study)
+            run["study/study"] = _as_pickle_stream(study)
         else:
             run["study/study_name"] = study.study_name
-            if isinstance(study._storage, optuna.storages.RedisStorage):
-                run["study/storage_type"] = "RedisStorage"
-                run["study/storage_url"] = study._storage._url
-            elif isinstance(study._storage, optuna.storages._CachedStorage):
-                run["study/storage_type"] = "RDBStorage"  # apparently CachedStorage typically wraps RDBStorage
-                run["study/storage_url"] = study._storage._backend.url
-            elif isinstance(study._storage, optuna.storages.RDBStorage):
-                run["study/storage_type"] = "RDBStorage"
-                run["study/storage_url"] = study._storage.url
-            else:
-                run["study/storage_type"] = "unknown storage type"
-                run["study/storage_url"] = "unknown storage url"
+            storage_type, get_url = _storage_info(study._storage)
+            run["study/storage_type"] = storage_type
+            run["study/storage_url"] = get_url(study._storage) if get_url is not None else "unknown storage url"
 
 
 def _log_plots(
@@ -508,79 +841,81 @@ def _log_plots(
     log_plot_intermediate_values=True,
     log_plot_optimization_history=True,
     namespaces: Optional[List[str]] = None,
+    trials: Optional[List[optuna.trial.FrozenTrial]] = None,
+    vis_module=None,
 ):
-    if visualization_backend == "matplotlib":
-        import optuna.visualization.matplotlib as vis
-    elif visualization_backend == "plotly":
-        import optuna.visualization as vis
-    else:
-        raise NotImplementedError(f"{visualization_backend} visualisation backend is not implemented")
+    if trials is None:
+        trials = study.get_trials(deepcopy=False)
+
+    # Nothing to plot before the first COMPLETE trial; Optuna's plot functions would
+    # either raise or produce empty figures, so skip the render (and for the lazy
+    # path even the backend import) entirely.
+    if not any(trial.state == optuna.trial.TrialState.COMPLETE for trial in trials):
+        return
+
+    vis = vis_module if vis_module is not None else _get_vis_module(visualization_backend)
 
     handle = run["visualizations"]
 
-    for i in range(len(study.directions)):
-        if isinstance(namespaces, list):
-            target = lambda t: t.values[i]  # noqa: E731
-            target_name = namespaces[i]
-            temp_handle = handle[namespaces[i]]
-        else:
-            target = None
-            target_name = namespaces
-            temp_handle = handle
+    # Independent of the objective direction, so computed once instead of per direction.
+    has_params = any(trial.params for trial in trials)
+    n_complete_or_pruned = sum(
+        trial.state in (optuna.trial.TrialState.COMPLETE, optuna.trial.TrialState.PRUNED) for trial in trials
+    )
 
-        if vis.is_available:
-            params = [p_name for t in study.trials for p_name in t.params.keys()]
+    if not vis.is_available:
+        return
 
-            if log_plot_contour and any(params):
-                temp_handle["plot_contour"] = neptune.types.File.as_html(
-                    vis.plot_contour(study, target=target, target_name=target_name)
-                )
+    # Per-direction (target, target_name, handle) triples, built once up front; the
+    # target selectors bind their index as a default so they stay valid after the loop.
+    if isinstance(namespaces, list):
+        directions = [
+            (lambda t, i=i: t.values[i], namespaces[i], handle[namespaces[i]])  # noqa: E731
+            for i in range(len(study.directions))
+        ]
+    else:
+        directions = [(None, namespaces, handle)]
 
-            if log_plot_edf:
-                temp_handle["plot_edf"] = neptune.types.File.as_html(
-                    vis.plot_edf(study, target=target, target_name=target_name)
-                )
+    # Each job is (handle, field, render, suppressed exceptions).
+    jobs = []
 
-            if log_plot_parallel_coordinate:
-                temp_handle["plot_parallel_coordinate"] = neptune.types.File.as_html(
-                    vis.plot_parallel_coordinate(study, target=target, target_name=target_name)
-                )
+    for target, target_name, temp_handle in directions:
 
-            if (
-                log_plot_param_importances
-                and len(
-                    study.get_trials(
-                        states=(
-                            optuna.trial.TrialState.COMPLETE,
-                            optuna.trial.TrialState.PRUNED,
-                        )
-                    )
-                )
-                > 1
-            ):
-                with contextlib.suppress(RuntimeError, ValueError, ZeroDivisionError):
-                    temp_handle["plot_param_importances"] = neptune.types.File.as_html(
-                        vis.plot_param_importances(study, target=target, target_name=target_name)
-                    )
-            if log_plot_slice and any(params):
-                temp_handle["plot_slice"] = neptune.types.File.as_html(
-                    vis.plot_slice(study, target=target, target_name=target_name)
-                )
+        def job(plot_fn, target=target, target_name=target_name):
+            return lambda: plot_fn(study, target=target, target_name=target_name)
 
-            if (
-                not _is_multi_objective(study=study)
-                and log_plot_intermediate_values
-                and any(trial.intermediate_values for trial in study.trials)
-            ):
-                # Intermediate values plot if available only if the above condition is met
-                temp_handle["plot_intermediate_values"] = neptune.types.File.as_html(
-                    vis.plot_intermediate_values(study)
-                )
+        if log_plot_contour and has_params:
+            jobs.append((temp_handle, "plot_contour", job(vis.plot_contour), ()))
+
+        if log_plot_edf:
+            jobs.append((temp_handle, "plot_edf", job(vis.plot_edf), ()))
 
-            if log_plot_optimization_history:
-                temp_handle["plot_optimization_history"] = neptune.types.File.as_html(
-                    vis.plot_optimization_history(study, target=target, target_name=target_name)
+        if log_plot_parallel_coordinate:
+            jobs.append((temp_handle, "plot_parallel_coordinate", job(vis.plot_parallel_coordinate), ()))
+
+        if log_plot_param_importances and n_complete_or_pruned > 1:
+            jobs.append(
+                (
+                    temp_handle,
+                    "plot_param_importances",
+                    job(vis.plot_param_importances),
+                    (RuntimeError, ValueError, ZeroDivisionError),
                 )
+            )
+
+        if log_plot_slice and has_params:
+            jobs.append((temp_handle, "plot_slice", job(vis.plot_slice), ()))
+
+        if (
+            not _is_multi_objective(study=study)
+            and log_plot_intermediate_values
+            and any(trial.intermediate_values for trial in trials)
+        ):
+            # Intermediate values plot if available only if the above condition is met
+            jobs.append((temp_handle, "plot_intermediate_values", lambda: vis.plot_intermediate_values(study), ()))
+
+        if log_plot_optimization_history:
+            jobs.append((temp_handle, "plot_optimization_history", job(vis.plot_optimization_history), ()))
 
     if (
         vis.is_available
@@ -588,44 +923,105 @@ def _log_plots(
         and _is_multi_objective(study=study)
         and visualization_backend == "plotly"
     ):
-        handle["plot_pareto_front"] = neptune.types.File.as_html(vis.plot_pareto_front(study, target_names=namespaces))
-
+        jobs.append((handle, "plot_pareto_front", lambda: vis.plot_pareto_front(study, target_names=namespaces), ()))
+
+    def run_job(job_spec):
+        job_handle, field, render, suppressed = job_spec
+        with contextlib.suppress(*suppressed):
+            job_handle[field] = neptune.types.File.as_html(render())
+
+    if visualization_backend == "plotly" and len(jobs) > 1:
+        # Plotly figure construction is thread-safe and CPU-bound, so the independent
+        # plots render concurrently; matplotlib must stay single-threaded.
+        with ThreadPoolExecutor(max_workers=min(len(jobs), _PLOT_RENDER_WORKERS)) as executor:
+            for _ in executor.map(run_job, jobs):
+                pass
+    else:
+        for job_spec in jobs:
+            run_job(job_spec)
+
+
+def _log_best_summary(handle, trial: optuna.trial.FrozenTrial, namespaces, is_multi: bool):
+    """Writes the scalar best/* summary fields from a single trial as one batched assignment."""
+    params = stringify_unsupported(trial.params)
+    if is_multi:
+        handle.assign(
+            {
+                "params": params,
+                "values": {namespaces[k]: stringify_unsupported(v) for k, v in enumerate(trial.values)},
+            }
+        )
+    else:
+        handle.assign(
+            {
+                "value": stringify_unsupported(trial.value),
+                "params": params,
+                "value|params": f"value: {trial.value}| params: {trial.params}",
+            }
+        )
 
-def _log_single_trial(run, study: optuna.Study, trial: optuna.trial.FrozenTrial, namespaces, best=False):
-    handle = run["best"] if best else run["trials"]
-    handle[f"trials/{trial._number}/datetime_start"] = trial.datetime_start
-    handle[f"trials/{trial._number}/datetime_complete"] = trial.datetime_complete
-    handle[f"trials/{trial._number}/duration"] = stringify_unsupported(trial.duration)
-    handle[f"trials/{trial._number}/distributions"] = stringify_unsupported(trial.distributions)
-    handle[f"trials/{trial._number}/intermediate_values"] = stringify_unsupported(trial.intermediate_values)
-    handle[f"trials/{trial._number}/params"] = stringify_unsupported(trial.params)
-    handle[f"trials/{trial._number}/user_attrs"] = stringify_unsupported(trial.user_attrs)
 
-    if _is_multi_objective(study=study):
-        for k, v in enumerate(trial.values):
-            handle[f"trials/{trial._number}/values/{namespaces[k]}"] = stringify_unsupported(v)
+def _log_single_trial(
+    run,
+    study: optuna.Study,
+    trial: optuna.trial.FrozenTrial,
+    namespaces,
+    best=False,
+    is_multi=None,
+    handle=None,
+    step=None,
+    summary=True,
+):
+    if is_multi is None:
+        is_multi = _is_multi_objective(study=study)
+
+    if handle is None:
+        handle = run["best"] if best else run["trials"]
+
+    if step is None:
+        step = trial._number
+
+    # Stringify each attribute once; the wrapped values are reused below instead of
+    # re-walking the params/values dicts per write.
+    params = stringify_unsupported(trial.params)
+
+    # One dict assignment queues all static fields as a single batched operation.
+    trial_dict = {
+        "datetime_start": trial.datetime_start,
+        "datetime_complete": trial.datetime_complete,
+        "duration": stringify_unsupported(trial.duration),
+        "distributions": stringify_unsupported(trial.distributions),
+        "intermediate_values": stringify_unsupported(trial.intermediate_values),
+        "params": params,
+        "user_attrs": stringify_unsupported(trial.user_attrs),
+    }
+
+    if is_multi:
+        values_dict = {namespaces[k]: stringify_unsupported(v) for k, v in enumerate(trial.values)}
+        trial_dict["values"] = values_dict
         if best:
-            handle["params"] = stringify_unsupported(trial.params)
-            for k, v in enumerate(trial.values):
-                handle[f"values/{namespaces[k]}"] = stringify_unsupported(v)
+            if summary:
+                _log_best_summary(handle, trial, namespaces, is_multi)
         else:
-            handle["params"].append(stringify_unsupported(trial.params))
+            handle["params"].append(params)
             for k, v in enumerate(trial.values):
-                handle[f"values/{namespaces[k]}"].append(stringify_unsupported(v), step=trial._number)
+                handle[f"values/{namespaces[k]}"].append(stringify_unsupported(v), step=step)
 
     else:
-        handle[f"trials/{trial._number}/value"] = stringify_unsupported(trial.value)
+        value = stringify_unsupported(trial.value)
+        trial_dict["value"] = value
         if best:
-            handle["value"] = stringify_unsupported(trial.value)
-            handle["params"] = stringify_unsupported(trial.params)
-            handle["value|params"] = f"value: {trial.value}| params: {trial.params}"
+            if summary:
+                _log_best_summary(handle, trial, namespaces, is_multi)
         else:
-            handle["values"].append(stringify_unsupported(trial.value), step=trial._number)
-            handle["params"].append(stringify_unsupported(trial.params))
+            handle["values"].append(value, step=step)
+            handle["params"].append(params)
             handle["values|params"].append(f"value: {trial.value}| params: {trial.params}")
 
     if trial.state.is_finished() and trial.state != optuna.trial.TrialState.COMPLETE:
-        handle[f"trials/{trial._number}/state"] = repr(trial.state)
+        trial_dict["state"] = repr(trial.state)
+
+    handle[f"trials/{trial._number}"] = trial_dict
 
 
 def _log_trials(
@@ -634,14 +1030,117 @@ def _log_trials(
     trials: Iterable[optuna.trial.FrozenTrial],
     namespaces,
     best=False,
+    is_multi=None,
 ):
-    if not study.best_trials and best:
+    if best and not _get_best_trials(study):
         return None
+
+    if is_multi is None:
+        is_multi = _is_multi_objective(study=study)
+
+    # Hot path for callbacks logging one trial at a time: skip the batching machinery.
+    if isinstance(trials, (list, tuple)) and len(trials) == 1:
+        return _log_single_trial(run, study, trials[0], namespaces, best=best, is_multi=is_multi)
+
+    # extend() requires ascending steps, and callers may pass trials in any order
+    # (best_trials, filtered subsets), so sort by trial number up front.
+    trials = sorted(trials, key=lambda t: t._number)
+
+    handle = run["best"] if best else run["trials"]
+
+    trials_dict = {}
+    steps = []
+    summary_rows = []
+    values_rows = [[] for _ in study.directions] if is_multi else []
+    last_trial = None
+
+    def _flush():
+        if trials_dict:
+            handle["trials"] = trials_dict.copy()
+            trials_dict.clear()
+
     for trial in trials:
-        _log_single_trial(run, study, trial, namespaces, best=best)
+        params = stringify_unsupported(trial.params)
+        trial_dict = {
+            "datetime_start": trial.datetime_start,
+            "datetime_complete": trial.datetime_complete,
+            "duration": stringify_unsupported(trial.duration),
+            "distributions": stringify_unsupported(trial.distributions),
+            "intermediate_values": stringify_unsupported(trial.intermediate_values),
+            "params": params,
+            "user_attrs": stringify_unsupported(trial.user_attrs),
+        }
+
+        if is_multi:
+            trial_dict["values"] = {namespaces[k]: stringify_unsupported(v) for k, v in enumerate(trial.values)}
+            if not best:
+                steps.append(trial._number)
+                for k, v in enumerate(trial.values):
+                    values_rows[k].append(v)
+        else:
+            value = stringify_unsupported(trial.value)
+            trial_dict["value"] = value
+            if not best:
+                steps.append(trial._number)
+                values_rows.append(trial.value)
+                summary_rows.append(f"value: {trial.value}| params: {trial.params}")
+
+        if not best:
+            # params is a namespace of per-key series and keys can vary per trial
+            # (conditional search spaces), so it cannot ship as one dict-of-lists
+            # extend; the sorted loop keeps the appends in step order.
+            handle["params"].append(params)
+
+        if trial.state.is_finished() and trial.state != optuna.trial.TrialState.COMPLETE:
+            trial_dict["state"] = repr(trial.state)
+
+        trials_dict[str(trial._number)] = trial_dict
+        last_trial = trial
+
+        if len(trials_dict) >= _TRIALS_FLUSH_THRESHOLD:
+            _flush()
+
+    _flush()
+
+    if last_trial is None:
+        return None
+
+    if best:
+        # Matches the sequential behavior: the scalar summary reflects the last best trial.
+        handle["params"] = stringify_unsupported(last_trial.params)
+        if is_multi:
+            for k, v in enumerate(last_trial.values):
+                handle[f"values/{namespaces[k]}"] = stringify_unsupported(v)
+        else:
+            handle["value"] = stringify_unsupported(last_trial.value)
+            handle["value|params"] = f"value: {last_trial.value}| params: {last_trial.params}"
+    elif steps:
+        # extend() cannot cast a list of per-element StringifyValue wrappers (the
+        # attribute is silently never created), so the rows stay raw and each list
+        # is wrapped once, the form append() produces internally.
+        if is_multi:
+            for k, rows in enumerate(values_rows):
+                handle[f"values/{namespaces[k]}"].extend(stringify_unsupported(rows), steps=steps)
+        else:
+            handle["values"].extend(stringify_unsupported(values_rows), steps=steps)
+            handle["values|params"].extend(summary_rows)
+
+
+def _as_pickle_stream(obj):
+    """Pickles directly into a temp file instead of materializing the full byte string."""
+    import pickle
+    import tempfile
+
+    # Not SpooledTemporaryFile: it only became an io.IOBase subclass (which
+    # File.from_stream requires) in Python 3.11.
+    buffer = tempfile.TemporaryFile()
+    pickle.dump(obj, buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    buffer.seek(0)
+    return File.from_stream(buffer, extension="pkl")
 
 
 def _get_pickle(run: neptune.Run, path: str):
+    import mmap
     import os
     import pickle
     import tempfile
@@ -651,6 +1150,8 @@ def _get_pickle(run: neptune.Run, path: str):
         filepath = os.listdir(d)[0]
         full_path = os.path.join(d, filepath)
         with open(full_path, "rb") as file:
-            artifact = pickle.load(file)
+            # Unpickle straight from the page cache instead of buffering the file a second time.
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                artifact = pickle.loads(buffer)
 
     return artifact
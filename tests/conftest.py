@@ -0,0 +1,14 @@
+import pytest
+
+try:
+    from neptune import init_run
+except ImportError:
+    from neptune.new import init_run
+
+
+@pytest.fixture(scope="session")
+def run():
+    """One Neptune run shared by the whole session; tests isolate themselves via namespaces."""
+    run = init_run()
+    yield run
+    run.stop()
@@ -0,0 +1,158 @@
+import random
+
+import optuna
+import pytest
+from neptune.internal.types.stringify_value import StringifyValue
+
+import neptune_optuna.impl as npt_utils
+
+
+class StubHandle:
+    """Minimal stand-in for a Neptune run/handler, recording writes in memory."""
+
+    def __init__(self, run, path):
+        self._run = run
+        self._path = path
+
+    def _child_path(self, key):
+        return f"{self._path}/{key}" if self._path else str(key)
+
+    def __getitem__(self, key):
+        return StubHandle(self._run, self._child_path(key))
+
+    def __setitem__(self, key, value):
+        self[key].assign(value)
+
+    def __delitem__(self, key):
+        self._run.deleted.append(self._child_path(key))
+
+    def assign(self, value, wait=False):
+        self._run._record(self._path, value)
+
+    def append(self, value, step=None):
+        self._run.series.setdefault(self._path, []).append((step, value))
+
+    def extend(self, values, steps=None):
+        # Mirrors the client's cast_value_for_extend contract: a whole-list
+        # StringifyValue wrapper is unwrapped, while per-element wrappers (or dicts)
+        # cannot be cast — the real client warns and silently never creates the
+        # attribute, so the stub fails loudly instead.
+        if isinstance(values, StringifyValue):
+            values = values.value
+        values = list(values)
+        if any(isinstance(value, (StringifyValue, dict)) for value in values):
+            raise TypeError("extend() payload the client cannot cast")
+        if steps is None:
+            steps = [None] * len(values)
+        self._run.series.setdefault(self._path, []).extend(zip(steps, values))
+
+
+class StubRun(StubHandle):
+    def __init__(self):
+        super().__init__(self, "")
+        self.fields = {}
+        self.series = {}
+        self.deleted = []
+
+    def _record(self, path, value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                self._record(f"{path}/{key}", item)
+        else:
+            self.fields[path] = value
+
+
+def _make_study(n_trials=3, directions=None):
+    study = optuna.create_study(directions=directions)
+    n_objectives = len(study.directions)
+
+    for _ in range(n_trials):
+        trial = study.ask()
+        x = trial.suggest_float("x", -10, 10)
+        values = [x**2 + k for k in range(n_objectives)]
+        study.tell(trial, values[0] if n_objectives == 1 else values)
+
+    return study
+
+
+def test_get_namespaces_defaults():
+    single = _make_study(n_trials=1)
+    assert npt_utils._get_namespaces(single) == "objective_value"
+
+    multi = _make_study(n_trials=1, directions=["minimize", "minimize"])
+    assert npt_utils._get_namespaces(multi) == ["objective_0", "objective_1"]
+
+
+def test_get_namespaces_target_names():
+    single = _make_study(n_trials=1)
+    assert npt_utils._get_namespaces(single, ["loss"]) == "loss"
+
+    multi = _make_study(n_trials=1, directions=["minimize", "minimize"])
+    assert npt_utils._get_namespaces(multi, ["a", "b"]) == ["a", "b"]
+
+    with pytest.raises(AssertionError):
+        npt_utils._get_namespaces(multi, ["only_one"])
+
+
+def test_log_single_trial_records_fields_and_series():
+    study = _make_study(n_trials=1)
+    trial = study.trials[0]
+    run = StubRun()
+
+    npt_utils._log_single_trial(run, study, trial, namespaces="objective_value")
+
+    assert "trials/trials/0/params/x" in run.fields
+    assert "trials/trials/0/datetime_start" in run.fields
+    assert run.series["trials/values"] == [(0, run.series["trials/values"][0][1])]
+    assert len(run.series["trials/params"]) == 1
+    assert len(run.series["trials/values|params"]) == 1
+
+
+def test_log_single_trial_best_writes_summary():
+    study = _make_study(n_trials=1)
+    run = StubRun()
+
+    npt_utils._log_best_trials(run, study, namespaces="objective_value")
+
+    assert "best/value" in run.fields
+    assert "best/params/x" in run.fields
+    assert "best/value|params" in run.fields
+    assert "best/trials/0/params/x" in run.fields
+
+
+def test_log_trials_extends_series_in_step_order():
+    study = _make_study(n_trials=6)
+    shuffled = study.trials[:]
+    random.shuffle(shuffled)
+    run = StubRun()
+
+    npt_utils._log_trials(run, study, shuffled, namespaces="objective_value")
+
+    steps = [step for step, _ in run.series["trials/values"]]
+    assert steps == sorted(steps)
+    assert len(steps) == 6
+    # Concrete unwrapped floats, in trial-number order.
+    assert [value for _, value in run.series["trials/values"]] == [trial.value for trial in study.trials]
+    for number in range(6):
+        assert f"trials/trials/{number}/params/x" in run.fields
+
+
+def test_log_trials_multi_objective_series_per_namespace():
+    study = _make_study(n_trials=4, directions=["minimize", "minimize"])
+    run = StubRun()
+
+    npt_utils._log_trials(run, study, study.trials, namespaces=["a", "b"])
+
+    assert [value for _, value in run.series["trials/values/a"]] == [trial.values[0] for trial in study.trials]
+    assert [value for _, value in run.series["trials/values/b"]] == [trial.values[1] for trial in study.trials]
+    assert "trials/trials/0/values/a" in run.fields
+
+
+def test_log_study_details_records_direction():
+    study = _make_study(n_trials=1)
+    run = StubRun()
+
+    npt_utils._log_study_details(run, study)
+
+    assert run.fields["study/study_name"] == study.study_name
+    assert "study/direction" in run.fields